@@ -1,65 +1,84 @@
+from collections import OrderedDict
+from threading import Lock
+
+
 class Cache:
-    """In-memory cache for API responses."""
+    """In-memory LRU cache for API responses."""
+
+    # Maximum number of cache keys retained per data category
+    MAX_CACHE_SIZE = 1000
+
+    # Data category -> field used to deduplicate records within a cache entry
+    _SPECS: dict[str, str] = {
+        "prices": "time",
+        "financial_metrics": "report_period",
+        "line_items": "report_period",
+        "insider_trades": "filing_date",  # Could also use transaction_date if preferred
+        "company_news": "date",
+    }
 
     def __init__(self):
-        self._prices_cache: dict[str, list[dict[str, any]]] = {}
-        self._financial_metrics_cache: dict[str, list[dict[str, any]]] = {}
-        self._line_items_cache: dict[str, list[dict[str, any]]] = {}
-        self._insider_trades_cache: dict[str, list[dict[str, any]]] = {}
-        self._company_news_cache: dict[str, list[dict[str, any]]] = {}
-
-    def _merge_data(self, existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
-        """Merge existing and new data, avoiding duplicates based on a key field."""
-        if not existing:
-            return new_data
-
-        # Create a set of existing keys for O(1) lookup
-        existing_keys = {item[key_field] for item in existing}
-
-        # Only add items that don't exist yet
-        merged = existing.copy()
-        merged.extend([item for item in new_data if item[key_field] not in existing_keys])
-        return merged
-
-    def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached price data if available."""
-        return self._prices_cache.get(ticker)
-
-    def set_prices(self, ticker: str, data: list[dict[str, any]]):
-        """Append new price data to cache."""
-        self._prices_cache[ticker] = self._merge_data(self._prices_cache.get(ticker), data, key_field="time")
-
-    def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
-        """Get cached financial metrics if available."""
-        return self._financial_metrics_cache.get(ticker)
-
-    def set_financial_metrics(self, ticker: str, data: list[dict[str, any]]):
-        """Append new financial metrics to cache."""
-        self._financial_metrics_cache[ticker] = self._merge_data(self._financial_metrics_cache.get(ticker), data, key_field="report_period")
-
-    def get_line_items(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached line items if available."""
-        return self._line_items_cache.get(ticker)
-
-    def set_line_items(self, ticker: str, data: list[dict[str, any]]):
-        """Append new line items to cache."""
-        self._line_items_cache[ticker] = self._merge_data(self._line_items_cache.get(ticker), data, key_field="report_period")
-
-    def get_insider_trades(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached insider trades if available."""
-        return self._insider_trades_cache.get(ticker)
-
-    def set_insider_trades(self, ticker: str, data: list[dict[str, any]]):
-        """Append new insider trades to cache."""
-        self._insider_trades_cache[ticker] = self._merge_data(self._insider_trades_cache.get(ticker), data, key_field="filing_date")  # Could also use transaction_date if preferred
-
-    def get_company_news(self, ticker: str) -> list[dict[str, any]] | None:
-        """Get cached company news if available."""
-        return self._company_news_cache.get(ticker)
-
-    def set_company_news(self, ticker: str, data: list[dict[str, any]]):
-        """Append new company news to cache."""
-        self._company_news_cache[ticker] = self._merge_data(self._company_news_cache.get(ticker), data, key_field="date")
+        # Each entry holds the cached records alongside the set of their key-field values
+        self._caches: dict[str, OrderedDict[str, tuple[list[dict[str, any]], set]]] = {category: OrderedDict() for category in self._SPECS}
+
+        # One lock per category so agents hitting different data types don't contend
+        self._locks: dict[str, Lock] = {category: Lock() for category in self._SPECS}
+
+    def _merge_data(self, entry: tuple[list[dict], set], new_data: list[dict], key_field: str):
+        """Append new items in place, skipping keys already present before this merge."""
+        items, keys = entry
+        new_items = [item for item in new_data if item[key_field] not in keys]
+        items.extend(new_items)
+        keys.update(item[key_field] for item in new_items)
+
+    def get(self, category: str, ticker: str) -> list[dict[str, any]] | None:
+        """Get cached data for a category if available, marking it as most recently used."""
+        cache = self._caches[category]
+        with self._locks[category]:
+            entry = cache.get(ticker)
+            if entry is None:
+                return None
+            cache.move_to_end(ticker)
+            return entry[0]
+
+    def set(self, category: str, ticker: str, data: list[dict[str, any]]):
+        """Append new data for a category, evicting the least recently used entries beyond capacity."""
+        cache = self._caches[category]
+        key_field = self._SPECS[category]
+        with self._locks[category]:
+            entry = cache.get(ticker)
+            if entry is None:
+                cache[ticker] = (list(data), {item[key_field] for item in data})
+            else:
+                self._merge_data(entry, data, key_field)
+                cache.move_to_end(ticker)
+            while len(cache) > self.MAX_CACHE_SIZE:
+                cache.popitem(last=False)
+
+
+def _make_accessors(category: str):
+    """Build the get_<category>/set_<category> wrappers for a data category."""
+    label = category.replace("_", " ")
+
+    def getter(self: Cache, ticker: str) -> list[dict[str, any]] | None:
+        return self.get(category, ticker)
+
+    def setter(self: Cache, ticker: str, data: list[dict[str, any]]):
+        self.set(category, ticker, data)
+
+    getter.__name__, getter.__qualname__ = f"get_{category}", f"Cache.get_{category}"
+    setter.__name__, setter.__qualname__ = f"set_{category}", f"Cache.set_{category}"
+    getter.__doc__ = f"Get cached {label} if available."
+    setter.__doc__ = f"Append new {label} to cache."
+    return getter, setter
+
+
+# Generate get_prices/set_prices, get_financial_metrics/set_financial_metrics, etc.
+for _category in Cache._SPECS:
+    _getter, _setter = _make_accessors(_category)
+    setattr(Cache, _getter.__name__, _getter)
+    setattr(Cache, _setter.__name__, _setter)
+del _category, _getter, _setter
 
 
 # Global cache instance
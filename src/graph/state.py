@@ -5,6 +5,9 @@ from langchain_core.messages import BaseMessage
 
 
 import json
+from enum import Enum
+
+import orjson
 
 
 def merge_dicts(a: dict[str, any], b: dict[str, any]) -> dict[str, any]:
@@ -18,27 +21,75 @@ class AgentState(TypedDict):
     metadata: Annotated[dict[str, any], merge_dicts]
 
 
+def _to_serializable(obj):
+    """Fallback for types orjson cannot encode natively."""
+    if hasattr(obj, "to_dict"):  # Handle Pandas Series/DataFrame
+        return obj.to_dict()
+    elif isinstance(obj, Enum):  # orjson encodes enums by value, so the stdlib path must too
+        return obj.value
+    elif hasattr(obj, "__dict__"):  # Handle custom objects
+        return obj.__dict__
+    elif isinstance(obj, float):  # Float subclasses such as numpy.float64, which the stdlib encodes as plain numbers
+        return float(obj)
+    else:
+        return str(obj)  # Fallback to string representation
+
+
+# Route datetimes and dataclasses through _to_serializable so they render as they do on the stdlib path
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def _orjson_floatstr(value: float) -> str:
+    """Format a float as orjson would, keeping the stdlib's NaN/Infinity tokens."""
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "Infinity" if value > 0 else "-Infinity"
+    return orjson.dumps(float(value)).decode()
+
+
+class _ReasoningEncoder(json.JSONEncoder):
+    """Stdlib encoder that formats floats like orjson (1e-7 rather than 1e-07), so both paths print numbers alike."""
+
+    def default(self, obj):
+        return _to_serializable(obj)
+
+    def iterencode(self, o, _one_shot=False):
+        # Same as JSONEncoder.iterencode for indented output, with orjson's float formatting swapped in
+        return json.encoder._make_iterencode(
+            {} if self.check_circular else None,
+            self.default,
+            json.encoder.encode_basestring_ascii,
+            self.indent,
+            _orjson_floatstr,
+            self.key_separator,
+            self.item_separator,
+            self.sort_keys,
+            self.skipkeys,
+            _one_shot,
+        )(o, 0)
+
+
+def _dumps_reasoning(output) -> str:
+    """Pretty-print output as indented JSON, rendering identically whether orjson or the stdlib does the encoding."""
+    try:
+        encoded = orjson.dumps(output, default=_to_serializable, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        # orjson rejects a few inputs the stdlib accepts (e.g. integers wider than 64 bits)
+        encoded = None
+
+    # orjson writes NaN/Infinity as null and emits raw UTF-8, whereas the stdlib keeps NaN visible and escapes
+    # non-ASCII text. Any null could be a hidden NaN, so defer to the stdlib whenever one appears.
+    if encoded is not None and encoded.isascii() and b"null" not in encoded:
+        return encoded.decode()
+    return json.dumps(output, cls=_ReasoningEncoder, indent=2)
+
+
 def show_agent_reasoning(output, agent_name):
     print(f"\n{'=' * 10} {agent_name.center(28)} {'=' * 10}")
 
-    def convert_to_serializable(obj):
-        if hasattr(obj, "to_dict"):  # Handle Pandas Series/DataFrame
-            return obj.to_dict()
-        elif hasattr(obj, "__dict__"):  # Handle custom objects
-            return obj.__dict__
-        elif isinstance(obj, (int, float, bool, str)):
-            return obj
-        elif isinstance(obj, (list, tuple)):
-            return [convert_to_serializable(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {key: convert_to_serializable(value) for key, value in obj.items()}
-        else:
-            return str(obj)  # Fallback to string representation
-
     if isinstance(output, (dict, list)):
-        # Convert the output to JSON-serializable format
-        serializable_output = convert_to_serializable(output)
-        print(json.dumps(serializable_output, indent=2))
+        print(_dumps_reasoning(output))
     else:
         try:
             # Parse the string as JSON and pretty print it
@@ -1,19 +1,18 @@
 import os
 import json
-from langchain_anthropic import ChatAnthropic
-from langchain_deepseek import ChatDeepSeek
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_groq import ChatGroq
-from langchain_xai import ChatXAI
-from langchain_openai import ChatOpenAI, AzureChatOpenAI
-from langchain_openai import ChatOpenAI
-from langchain_gigachat import GigaChat
-from langchain_ollama import ChatOllama
+import sys
 from enum import Enum
-from pydantic import BaseModel
-from typing import Tuple, List
+from pydantic import BaseModel, PrivateAttr
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Tuple, List
 from pathlib import Path
 
+# Provider SDKs are imported inside get_model so only the selected one is loaded
+if TYPE_CHECKING:
+    from langchain_gigachat import GigaChat
+    from langchain_groq import ChatGroq
+    from langchain_ollama import ChatOllama
+    from langchain_openai import ChatOpenAI
+
 
 class ModelProvider(str, Enum):
     """Enum for supported LLM providers"""
@@ -33,6 +32,32 @@ class ModelProvider(str, Enum):
     XAI = "xAI"
 
 
+# Capability bits, computed once per model whenever its fields are set
+_IS_DEEPSEEK = 1 << 0
+_IS_GEMINI = 1 << 1
+_IS_OLLAMA = 1 << 2
+_HAS_JSON_MODE = 1 << 3
+
+# Ollama model families that support JSON mode, matched by substring so custom tags are covered too
+_OLLAMA_JSON_MODE_FAMILIES = ("llama3", "neural-chat")
+
+
+def _model_caps(model_name: str, provider: "ModelProvider") -> int:
+    """Derive the capability bitmask for a model name and provider"""
+    caps = 0
+    if model_name.startswith("deepseek"):
+        caps |= _IS_DEEPSEEK
+    if model_name.startswith("gemini"):
+        caps |= _IS_GEMINI
+    if provider == ModelProvider.OLLAMA:
+        caps |= _IS_OLLAMA
+    # DeepSeek and Gemini never support JSON mode; only certain Ollama models do
+    if not caps & (_IS_DEEPSEEK | _IS_GEMINI):
+        if not caps & _IS_OLLAMA or any(family in model_name for family in _OLLAMA_JSON_MODE_FAMILIES):
+            caps |= _HAS_JSON_MODE
+    return caps
+
+
 class LLMModel(BaseModel):
     """Represents an LLM model configuration"""
 
@@ -40,9 +65,37 @@ class LLMModel(BaseModel):
     model_name: str
     provider: ModelProvider
 
+    # State derived from the fields above, refreshed whenever they change. It is read from __pydantic_private__
+    # directly; self._caps would go through the much slower BaseModel.__getattr__
+    _caps: int = PrivateAttr(default=0)
+    _choice_tuple: Tuple[str, str, str] | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Runs after both validation and model_construct
+        self._refresh_derived()
+
+    def _refresh_derived(self) -> None:
+        """Recompute the capability bitmask and questionary choice tuple from the current fields"""
+        private = self.__pydantic_private__
+        private["_caps"] = _model_caps(self.model_name, self.provider)
+        # Intern the provider string so every model's choice tuple shares it
+        private["_choice_tuple"] = (self.display_name, self.model_name, sys.intern(ModelProvider(self.provider).value))
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> "LLMModel":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # model_copy neither validates nor runs model_post_init, so derived state must be refreshed here
+            copied._refresh_derived()
+        return copied
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in LLMModel.model_fields:
+            self._refresh_derived()
+
     def to_choice_tuple(self) -> Tuple[str, str, str]:
         """Convert to format needed for questionary choices"""
-        return (self.display_name, self.model_name, self.provider.value)
+        return self.__pydantic_private__["_choice_tuple"]
 
     def is_custom(self) -> bool:
         """Check if the model is a Gemini model"""
@@ -50,27 +103,19 @@ class LLMModel(BaseModel):
 
     def has_json_mode(self) -> bool:
         """Check if the model supports JSON mode"""
-        if self.is_deepseek() or self.is_gemini():
-            return False
-        # Only certain Ollama models support JSON mode
-        if self.is_ollama():
-            return "llama3" in self.model_name or "neural-chat" in self.model_name
-        # OpenRouter models generally support JSON mode
-        if self.provider == ModelProvider.OPENROUTER:
-            return True
-        return True
+        return bool(self.__pydantic_private__["_caps"] & _HAS_JSON_MODE)
 
     def is_deepseek(self) -> bool:
         """Check if the model is a DeepSeek model"""
-        return self.model_name.startswith("deepseek")
+        return bool(self.__pydantic_private__["_caps"] & _IS_DEEPSEEK)
 
     def is_gemini(self) -> bool:
         """Check if the model is a Gemini model"""
-        return self.model_name.startswith("gemini")
+        return bool(self.__pydantic_private__["_caps"] & _IS_GEMINI)
 
     def is_ollama(self) -> bool:
         """Check if the model is an Ollama model"""
-        return self.provider == ModelProvider.OLLAMA
+        return bool(self.__pydantic_private__["_caps"] & _IS_OLLAMA)
 
 
 # Load models from JSON file
@@ -110,11 +155,15 @@ LLM_ORDER = [model.to_choice_tuple() for model in AVAILABLE_MODELS]
 # Create Ollama LLM_ORDER separately
 OLLAMA_LLM_ORDER = [model.to_choice_tuple() for model in OLLAMA_MODELS]
 
+# Index all models by (model_name, provider value) for constant-time lookups
+_MODEL_BY_KEY: dict[tuple[str, str], LLMModel] = {(model.model_name, model.provider.value): model for model in (*AVAILABLE_MODELS, *OLLAMA_MODELS)}
+
 
 def get_model_info(model_name: str, model_provider: str) -> LLMModel | None:
     """Get model information by model_name"""
-    all_models = AVAILABLE_MODELS + OLLAMA_MODELS
-    return next((model for model in all_models if model.model_name == model_name and model.provider == model_provider), None)
+    # Accept either a ModelProvider member or its plain string value
+    provider = getattr(model_provider, "value", model_provider)
+    return _MODEL_BY_KEY.get((model_name, provider))
 
 
 def get_models_list():
@@ -129,42 +178,89 @@ def get_models_list():
     ]
 
 
-def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> ChatOpenAI | ChatGroq | ChatOllama | GigaChat | None:
-    if model_provider == ModelProvider.GROQ:
-        api_key = (api_keys or {}).get("GROQ_API_KEY") or os.getenv("GROQ_API_KEY")
-        if not api_key:
-            # Print error to console
-            print(f"API Key Error: Please make sure GROQ_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("Groq API key not found.  Please make sure GROQ_API_KEY is set in your .env file or provided via API keys.")
-        return ChatGroq(model=model_name, api_key=api_key)
-    elif model_provider == ModelProvider.OPENAI:
-        # Get and validate API key
-        api_key = (api_keys or {}).get("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
-        base_url = os.getenv("OPENAI_API_BASE")
+def _create_groq(model_name: str, api_key: str):
+    from langchain_groq import ChatGroq
+
+    return ChatGroq(model=model_name, api_key=api_key)
+
+
+def _create_openai(model_name: str, api_key: str):
+    from langchain_openai import ChatOpenAI
+
+    base_url = os.getenv("OPENAI_API_BASE")
+    return ChatOpenAI(model=model_name, api_key=api_key, base_url=base_url)
+
+
+def _create_anthropic(model_name: str, api_key: str):
+    from langchain_anthropic import ChatAnthropic
+
+    return ChatAnthropic(model=model_name, api_key=api_key)
+
+
+def _create_deepseek(model_name: str, api_key: str):
+    from langchain_deepseek import ChatDeepSeek
+
+    return ChatDeepSeek(model=model_name, api_key=api_key)
+
+
+def _create_google(model_name: str, api_key: str):
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(model=model_name, api_key=api_key)
+
+
+def _create_openrouter(model_name: str, api_key: str):
+    from langchain_openai import ChatOpenAI
+
+    # Get optional site URL and name for headers
+    site_url = os.getenv("YOUR_SITE_URL", "https://github.com/virattt/ai-hedge-fund")
+    site_name = os.getenv("YOUR_SITE_NAME", "AI Hedge Fund")
+
+    return ChatOpenAI(
+        model=model_name,
+        openai_api_key=api_key,
+        openai_api_base="https://openrouter.ai/api/v1",
+        model_kwargs={
+            "extra_headers": {
+                "HTTP-Referer": site_url,
+                "X-Title": site_name,
+            }
+        }
+    )
+
+
+def _create_xai(model_name: str, api_key: str):
+    from langchain_xai import ChatXAI
+
+    return ChatXAI(model=model_name, api_key=api_key)
+
+
+# Providers that authenticate with a single API key: provider -> (API key name, factory)
+_API_KEY_PROVIDERS: dict[ModelProvider, Tuple[str, Callable[[str, str], Any]]] = {
+    ModelProvider.GROQ: ("GROQ_API_KEY", _create_groq),
+    ModelProvider.OPENAI: ("OPENAI_API_KEY", _create_openai),
+    ModelProvider.ANTHROPIC: ("ANTHROPIC_API_KEY", _create_anthropic),
+    ModelProvider.DEEPSEEK: ("DEEPSEEK_API_KEY", _create_deepseek),
+    ModelProvider.GOOGLE: ("GOOGLE_API_KEY", _create_google),
+    ModelProvider.OPENROUTER: ("OPENROUTER_API_KEY", _create_openrouter),
+    ModelProvider.XAI: ("XAI_API_KEY", _create_xai),
+}
+
+
+def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> "ChatOpenAI | ChatGroq | ChatOllama | GigaChat | None":
+    provider_config = _API_KEY_PROVIDERS.get(model_provider)
+    if provider_config:
+        key_name, factory = provider_config
+        api_key = (api_keys or {}).get(key_name) or os.getenv(key_name)
         if not api_key:
             # Print error to console
-            print(f"API Key Error: Please make sure OPENAI_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("OpenAI API key not found.  Please make sure OPENAI_API_KEY is set in your .env file or provided via API keys.")
-        return ChatOpenAI(model=model_name, api_key=api_key, base_url=base_url)
-    elif model_provider == ModelProvider.ANTHROPIC:
-        api_key = (api_keys or {}).get("ANTHROPIC_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure ANTHROPIC_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("Anthropic API key not found.  Please make sure ANTHROPIC_API_KEY is set in your .env file or provided via API keys.")
-        return ChatAnthropic(model=model_name, api_key=api_key)
-    elif model_provider == ModelProvider.DEEPSEEK:
-        api_key = (api_keys or {}).get("DEEPSEEK_API_KEY") or os.getenv("DEEPSEEK_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure DEEPSEEK_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("DeepSeek API key not found.  Please make sure DEEPSEEK_API_KEY is set in your .env file or provided via API keys.")
-        return ChatDeepSeek(model=model_name, api_key=api_key)
-    elif model_provider == ModelProvider.GOOGLE:
-        api_key = (api_keys or {}).get("GOOGLE_API_KEY") or os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure GOOGLE_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("Google API key not found.  Please make sure GOOGLE_API_KEY is set in your .env file or provided via API keys.")
-        return ChatGoogleGenerativeAI(model=model_name, api_key=api_key)
-    elif model_provider == ModelProvider.OLLAMA:
+            print(f"API Key Error: Please make sure {key_name} is set in your .env file or provided via API keys.")
+            raise ValueError(f"{ModelProvider(model_provider).value} API key not found. Please make sure {key_name} is set in your .env file or provided via API keys.")
+        return factory(model_name, api_key)
+
+    if model_provider == ModelProvider.OLLAMA:
+        from langchain_ollama import ChatOllama
+
         # For Ollama, we use a base URL instead of an API key
         # Check if OLLAMA_HOST is set (for Docker on macOS)
         ollama_host = os.getenv("OLLAMA_HOST", "localhost")
@@ -173,34 +269,9 @@ def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = N
             model=model_name,
             base_url=base_url,
         )
-    elif model_provider == ModelProvider.OPENROUTER:
-        api_key = (api_keys or {}).get("OPENROUTER_API_KEY") or os.getenv("OPENROUTER_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure OPENROUTER_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("OpenRouter API key not found. Please make sure OPENROUTER_API_KEY is set in your .env file or provided via API keys.")
-        
-        # Get optional site URL and name for headers
-        site_url = os.getenv("YOUR_SITE_URL", "https://github.com/virattt/ai-hedge-fund")
-        site_name = os.getenv("YOUR_SITE_NAME", "AI Hedge Fund")
-        
-        return ChatOpenAI(
-            model=model_name,
-            openai_api_key=api_key,
-            openai_api_base="https://openrouter.ai/api/v1",
-            model_kwargs={
-                "extra_headers": {
-                    "HTTP-Referer": site_url,
-                    "X-Title": site_name,
-                }
-            }
-        )
-    elif model_provider == ModelProvider.XAI:
-        api_key = (api_keys or {}).get("XAI_API_KEY") or os.getenv("XAI_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure XAI_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("xAI API key not found. Please make sure XAI_API_KEY is set in your .env file or provided via API keys.")
-        return ChatXAI(model=model_name, api_key=api_key)
     elif model_provider == ModelProvider.GIGACHAT:
+        from langchain_gigachat import GigaChat
+
         if os.getenv("GIGACHAT_USER") or os.getenv("GIGACHAT_PASSWORD"):
             return GigaChat(model=model_name)
         else: 
@@ -211,6 +282,8 @@ def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = N
 
             return GigaChat(credentials=api_key, model=model_name)
     elif model_provider == ModelProvider.AZURE_OPENAI:
+        from langchain_openai import AzureChatOpenAI
+
         # Get and validate API key
         api_key = os.getenv("AZURE_OPENAI_API_KEY")
         if not api_key:
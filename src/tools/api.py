@@ -1,8 +1,10 @@
 import datetime
+import numpy as np
 import os
 import pandas as pd
 import requests
 import time
+from pydantic import TypeAdapter
 
 from src.data.cache import get_cache
 from src.data.models import (
@@ -22,6 +24,15 @@ from src.data.models import (
 # Global cache instance
 _cache = get_cache()
 
+# Validate cached rows in one pydantic-core call per list instead of one model construction per row
+_PRICE_LIST_ADAPTER = TypeAdapter(list[Price])
+_FINANCIAL_METRICS_LIST_ADAPTER = TypeAdapter(list[FinancialMetrics])
+_INSIDER_TRADE_LIST_ADAPTER = TypeAdapter(list[InsiderTrade])
+_COMPANY_NEWS_LIST_ADAPTER = TypeAdapter(list[CompanyNews])
+
+# numpy dtype for each Price field, derived from the model so the columnar view tracks its schema
+_PRICE_COLUMN_DTYPES: dict[str, type] = {name: {float: np.float64, int: np.int64}.get(field.annotation, str) for name, field in Price.model_fields.items()}
+
 
 def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> requests.Response:
     """
@@ -57,14 +68,19 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
         return response
 
 
+def _price_cache_key(ticker: str, start_date: str, end_date: str) -> str:
+    """Build the cache key for a ticker's prices over an exact date range."""
+    return f"{ticker}_{start_date}_{end_date}"
+
+
 def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None) -> list[Price]:
     """Fetch price data from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
-    cache_key = f"{ticker}_{start_date}_{end_date}"
+    cache_key = _price_cache_key(ticker, start_date, end_date)
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_prices(cache_key):
-        return [Price(**price) for price in cached_data]
+        return _PRICE_LIST_ADAPTER.validate_python(cached_data)
 
     # If not in cache, fetch from API
     headers = {}
@@ -102,7 +118,7 @@ def get_financial_metrics(
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_financial_metrics(cache_key):
-        return [FinancialMetrics(**metric) for metric in cached_data]
+        return _FINANCIAL_METRICS_LIST_ADAPTER.validate_python(cached_data)
 
     # If not in cache, fetch from API
     headers = {}
@@ -177,7 +193,7 @@ def get_insider_trades(
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_insider_trades(cache_key):
-        return [InsiderTrade(**trade) for trade in cached_data]
+        return _INSIDER_TRADE_LIST_ADAPTER.validate_python(cached_data)
 
     # If not in cache, fetch from API
     headers = {}
@@ -239,7 +255,7 @@ def get_company_news(
     
     # Check cache first - simple exact match
     if cached_data := _cache.get_company_news(cache_key):
-        return [CompanyNews(**news) for news in cached_data]
+        return _COMPANY_NEWS_LIST_ADAPTER.validate_python(cached_data)
 
     # If not in cache, fetch from API
     headers = {}
@@ -326,7 +342,18 @@ def get_market_cap(
 
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
+    return _index_price_frame(pd.DataFrame([p.model_dump() for p in prices]))
+
+
+def _prices_to_columns(prices: list[dict]) -> dict[str, np.ndarray]:
+    """Convert cached price rows into one array per Price field."""
+    # Snapshot so a concurrent cache merge can't change the length between columns
+    prices = prices[:]
+    return {field: np.array([price[field] for price in prices], dtype=dtype) for field, dtype in _PRICE_COLUMN_DTYPES.items()}
+
+
+def _index_price_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Index a raw price frame by date and coerce its numeric columns."""
     df["Date"] = pd.to_datetime(df["time"])
     df.set_index("Date", inplace=True)
     numeric_cols = ["open", "close", "high", "low", "volume"]
@@ -338,5 +365,9 @@ def prices_to_df(prices: list[Price]) -> pd.DataFrame:
 
 # Update the get_price_data function to use the new functions
 def get_price_data(ticker: str, start_date: str, end_date: str, api_key: str = None) -> pd.DataFrame:
+    # On a cache hit, build the frame straight from column arrays instead of per-row Price objects
+    if cached_data := _cache.get_prices(_price_cache_key(ticker, start_date, end_date)):
+        return _index_price_frame(pd.DataFrame(_prices_to_columns(cached_data)))
+
     prices = get_prices(ticker, start_date, end_date, api_key=api_key)
     return prices_to_df(prices)
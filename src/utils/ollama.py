@@ -3,6 +3,7 @@
 import platform
 import subprocess
 import requests
+import threading
 import time
 from typing import List
 import questionary
@@ -15,6 +16,41 @@ OLLAMA_SERVER_URL = "http://localhost:11434"
 OLLAMA_API_MODELS_ENDPOINT = f"{OLLAMA_SERVER_URL}/api/tags"
 OLLAMA_DOWNLOAD_URL = {"darwin": "https://ollama.com/download/darwin", "windows": "https://ollama.com/download/windows", "linux": "https://ollama.com/download/linux"}  # macOS  # Windows  # Linux
 INSTALLATION_INSTRUCTIONS = {"darwin": "curl -fsSL https://ollama.com/install.sh | sh", "windows": "# Download from https://ollama.com/download/windows and run the installer", "linux": "curl -fsSL https://ollama.com/install.sh | sh"}
+OLLAMA_MODELS_CACHE_TTL = 10.0  # Seconds to reuse a successful /api/tags response
+
+# Reuse one HTTP connection to the local server and remember the last successful model listing
+_session = requests.Session()
+_models_cache: tuple[float, List[str]] | None = None
+_models_cache_lock = threading.Lock()
+
+
+def _fetch_local_models(timeout: float) -> List[str] | None:
+    """Return the model names reported by the Ollama server, or None if it is unreachable."""
+    global _models_cache
+    with _models_cache_lock:
+        if _models_cache is not None and time.monotonic() - _models_cache[0] < OLLAMA_MODELS_CACHE_TTL:
+            return _models_cache[1]
+
+    try:
+        response = _session.get(OLLAMA_API_MODELS_ENDPOINT, timeout=timeout)
+        if response.status_code != 200:
+            return None
+        data = response.json()
+    except requests.RequestException:
+        return None
+
+    models = [model["name"] for model in data["models"]] if "models" in data else []
+    # Only successful responses are cached so callers polling for server startup still see it come up
+    with _models_cache_lock:
+        _models_cache = (time.monotonic(), models)
+    return models
+
+
+def _invalidate_models_cache() -> None:
+    """Forget the cached model listing after models are added or removed."""
+    global _models_cache
+    with _models_cache_lock:
+        _models_cache = None
 
 
 def is_ollama_installed() -> bool:
@@ -39,26 +75,13 @@ def is_ollama_installed() -> bool:
 
 def is_ollama_server_running() -> bool:
     """Check if the Ollama server is running."""
-    try:
-        response = requests.get(OLLAMA_API_MODELS_ENDPOINT, timeout=2)
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
+    return _fetch_local_models(timeout=2) is not None
 
 
 def get_locally_available_models() -> List[str]:
     """Get a list of models that are already downloaded locally."""
-    if not is_ollama_server_running():
-        return []
-
-    try:
-        response = requests.get(OLLAMA_API_MODELS_ENDPOINT, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            return [model["name"] for model in data["models"]] if "models" in data else []
-        return []
-    except requests.RequestException:
-        return []
+    models = _fetch_local_models(timeout=5)
+    return list(models) if models is not None else []
 
 
 def start_ollama_server() -> bool:
@@ -274,6 +297,7 @@ def download_model(model_name: str) -> bool:
 
         # Wait for the process to finish
         return_code = process.wait()
+        _invalidate_models_cache()
 
         # Ensure we print a newline after the progress bar
         print()
@@ -359,6 +383,7 @@ def delete_model(model_name: str) -> bool:
     try:
         # Use the Ollama CLI to delete the model
         process = subprocess.run(["ollama", "rm", model_name], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        _invalidate_models_cache()
         
         if process.returncode == 0:
             print(f"{Fore.GREEN}Model {model_name} deleted successfully.{Style.RESET_ALL}")
@@ -0,0 +1,57 @@
+from src.data.cache import Cache
+
+
+class TestCache:
+    """Test suite for the in-memory API response cache."""
+
+    def test_merges_without_duplicates(self):
+        """Test that repeated writes only append unseen records."""
+        cache = Cache()
+        cache.set_prices("AAPL", [{"time": "2024-01-01", "close": 1.0}])
+        cache.set_prices("AAPL", [{"time": "2024-01-01", "close": 1.0}, {"time": "2024-01-02", "close": 2.0}])
+
+        assert cache.get_prices("AAPL") == [
+            {"time": "2024-01-01", "close": 1.0},
+            {"time": "2024-01-02", "close": 2.0},
+        ]
+
+    def test_keeps_same_key_records_within_one_write(self):
+        """Test that records sharing a key field in a single write are all kept."""
+        cache = Cache()
+        trades = [
+            {"filing_date": "2024-01-01", "name": "A"},
+            {"filing_date": "2024-01-01", "name": "B"},
+        ]
+        cache.set_insider_trades("AAPL", trades)
+        cache.set_insider_trades("AAPL", [{"filing_date": "2024-01-01", "name": "C"}])
+
+        assert [trade["name"] for trade in cache.get_insider_trades("AAPL")] == ["A", "B"]
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used key is evicted once the cache is full."""
+        cache = Cache()
+        cache.MAX_CACHE_SIZE = 2
+        cache.set_company_news("AAPL", [{"date": "2024-01-01"}])
+        cache.set_company_news("MSFT", [{"date": "2024-01-01"}])
+
+        # Touch AAPL so MSFT becomes the eviction candidate
+        assert cache.get_company_news("AAPL") is not None
+        cache.set_company_news("NVDA", [{"date": "2024-01-01"}])
+
+        assert cache.get_company_news("MSFT") is None
+        assert cache.get_company_news("AAPL") is not None
+        assert cache.get_company_news("NVDA") is not None
+
+    def test_missing_ticker_returns_none(self):
+        """Test that a cache miss returns None."""
+        cache = Cache()
+
+        assert cache.get_financial_metrics("AAPL") is None
+
+    def test_named_accessors_share_generic_storage(self):
+        """Test that the generated per-category accessors read and write the generic cache."""
+        cache = Cache()
+        cache.set("line_items", "AAPL", [{"report_period": "2024-03-31"}])
+
+        assert cache.get_line_items("AAPL") == [{"report_period": "2024-03-31"}]
+        assert cache.get("prices", "AAPL") is None
@@ -0,0 +1,99 @@
+import json
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.graph.state import _to_serializable, show_agent_reasoning
+
+
+def _printed_body(capsys) -> str:
+    """Return what show_agent_reasoning printed between its banner lines."""
+    lines = capsys.readouterr().out.strip("\n").split("\n")
+    return "\n".join(lines[1:-1])
+
+
+class TestShowAgentReasoning:
+    """Test suite for agent reasoning pretty-printing."""
+
+    def test_keeps_non_finite_floats_visible(self, capsys):
+        """Test that NaN and infinities are printed as such rather than as null."""
+        output = {"a": float("nan"), "b": float("inf"), "c": float("-inf"), "d": 1.5}
+
+        show_agent_reasoning(output, "Agent")
+
+        body = _printed_body(capsys)
+        assert body == json.dumps(output, indent=2)
+        assert '"a": NaN' in body
+        assert '"b": Infinity' in body
+        assert "null" not in body
+
+    def test_escapes_non_ascii_text(self, capsys):
+        """Test that non-ASCII text is escaped the same way as json.dumps."""
+        output = {"reasoning": "Société Générale"}
+
+        show_agent_reasoning(output, "Agent")
+
+        assert _printed_body(capsys) == json.dumps(output, indent=2)
+
+    def test_pretty_prints_json_string_with_nan(self, capsys):
+        """Test that JSON strings containing NaN tokens are still parsed and pretty-printed."""
+        show_agent_reasoning('{"x": NaN}', "Agent")
+
+        assert _printed_body(capsys) == '{\n  "x": NaN\n}'
+
+    def test_prints_invalid_json_string_verbatim(self, capsys):
+        """Test that a string that is not JSON is printed as-is."""
+        show_agent_reasoning("not json", "Agent")
+
+        assert _printed_body(capsys) == "not json"
+
+    def test_renders_datetimes_and_floats_alike_on_both_paths(self, capsys):
+        """Test that a null-free payload (orjson) and the same payload plus a null (stdlib) print identically."""
+        output = {"d": datetime(2024, 1, 1, 12), "x": 1e-7, "y": 1e-5}
+
+        show_agent_reasoning(output, "Agent")
+        fast = _printed_body(capsys)
+        show_agent_reasoning({**output, "n": None}, "Agent")
+        fallback = _printed_body(capsys)
+
+        assert fallback == fast[:-2] + ',\n  "n": null\n}'
+        assert '"d": "2024-01-01 12:00:00"' in fast
+
+    def test_falls_back_to_stdlib_for_oversized_integers(self, capsys):
+        """Test that integers orjson cannot encode are printed via json.dumps."""
+        output = {"big": 2**70, "small": 1}
+
+        show_agent_reasoning(output, "Agent")
+
+        assert _printed_body(capsys) == json.dumps(output, indent=2)
+
+    def test_serializes_pandas_objects_via_to_dict(self, capsys):
+        """Test that pandas Series and DataFrames are printed through their to_dict form."""
+        series = pd.Series({"rsi": 55.0, "macd": 1.25})
+        frame = pd.DataFrame({"close": [1.0, 2.0]})
+        output = {"series": series, "frame": frame}
+
+        show_agent_reasoning(output, "Agent")
+
+        assert _printed_body(capsys) == json.dumps({"series": series.to_dict(), "frame": frame.to_dict()}, indent=2)
+
+    def test_serializes_custom_objects_via_dict(self, capsys):
+        """Test that plain objects are printed through their attribute dict."""
+
+        class Signal:
+            def __init__(self):
+                self.signal = "bullish"
+                self.confidence = 0.75
+
+        show_agent_reasoning([Signal()], "Agent")
+
+        assert _printed_body(capsys) == json.dumps([{"signal": "bullish", "confidence": 0.75}], indent=2)
+
+    def test_to_serializable_fallbacks(self):
+        """Test the remaining conversions for values orjson cannot encode natively."""
+        value = _to_serializable(np.float64(1.5))
+
+        assert value == 1.5 and type(value) is float
+        assert _to_serializable(np.int64(3)) == "3"
+        assert _to_serializable({1, 2}) in ("{1, 2}", "{2, 1}")
@@ -0,0 +1,77 @@
+from src.llm.models import LLMModel, ModelProvider, get_model_info
+
+
+class TestLLMModel:
+    """Test suite for LLM model capability flags and lookups."""
+
+    def test_json_mode_for_api_models(self):
+        """Test that API models support JSON mode except DeepSeek and Gemini."""
+        assert LLMModel(display_name="GPT-4o", model_name="gpt-4o", provider=ModelProvider.OPENAI).has_json_mode()
+        assert not LLMModel(display_name="DeepSeek", model_name="deepseek-chat", provider=ModelProvider.DEEPSEEK).has_json_mode()
+        assert not LLMModel(display_name="Gemini", model_name="gemini-2.5-pro", provider=ModelProvider.GOOGLE).has_json_mode()
+
+    def test_provider_flags(self):
+        """Test the DeepSeek, Gemini and Ollama flags, including a DeepSeek model served by Ollama."""
+        model = LLMModel(display_name="DeepSeek R1", model_name="deepseek-r1:8b", provider=ModelProvider.OLLAMA)
+
+        assert model.is_deepseek() and model.is_ollama()
+        assert not model.is_gemini()
+        assert not model.has_json_mode()
+
+    def test_json_mode_for_ollama_models(self):
+        """Test that only JSON-capable Ollama families report JSON mode."""
+        assert LLMModel(display_name="Llama", model_name="llama3.1:latest", provider=ModelProvider.OLLAMA).has_json_mode()
+        assert not LLMModel(display_name="Mistral", model_name="mistral-small3.1", provider=ModelProvider.OLLAMA).has_json_mode()
+
+    def test_json_mode_for_custom_ollama_tags(self):
+        """Test that JSON-capable Ollama families are matched by substring, so custom tags keep JSON mode."""
+        assert LLMModel(display_name="Custom", model_name="llama3.2:custom-tag", provider=ModelProvider.OLLAMA).has_json_mode()
+        assert LLMModel(display_name="Custom", model_name="neural-chat:7b-q4", provider=ModelProvider.OLLAMA).has_json_mode()
+        assert not LLMModel(display_name="Custom", model_name="mistral:custom-tag", provider=ModelProvider.OLLAMA).has_json_mode()
+
+    def test_flags_follow_model_copy_updates(self):
+        """Test that capability flags reflect fields changed through model_copy."""
+        model = LLMModel(display_name="GPT-4o", model_name="gpt-4o", provider=ModelProvider.OPENAI)
+        assert model.has_json_mode()
+
+        copied = model.model_copy(update={"model_name": "deepseek-chat"})
+
+        assert copied.is_deepseek()
+        assert not copied.has_json_mode()
+        assert model.has_json_mode()
+
+    def test_flags_for_unvalidated_models(self):
+        """Test that models built with model_construct still report correct flags."""
+        model = LLMModel.model_construct(display_name="GPT-4o", model_name="gpt-4o", provider=ModelProvider.OPENAI)
+
+        assert model.has_json_mode()
+        assert not model.is_deepseek()
+
+    def test_flags_follow_field_assignment(self):
+        """Test that assigning a field refreshes the stored capability flags."""
+        model = LLMModel(display_name="Llama", model_name="llama3.1:latest", provider=ModelProvider.OLLAMA)
+
+        model.model_name = "mistral-small3.1"
+
+        assert model.is_ollama()
+        assert not model.has_json_mode()
+
+    def test_choice_tuple_follows_model_copy_updates(self):
+        """Test that the cached choice tuple reflects fields changed through model_copy."""
+        model = LLMModel(display_name="GPT-4o", model_name="gpt-4o", provider=ModelProvider.OPENAI)
+        assert model.to_choice_tuple() == ("GPT-4o", "gpt-4o", "OpenAI")
+
+        copied = model.model_copy(update={"display_name": "Claude", "model_name": "claude-sonnet-4", "provider": ModelProvider.ANTHROPIC})
+
+        assert copied.to_choice_tuple() == ("Claude", "claude-sonnet-4", "Anthropic")
+        assert model.to_choice_tuple() is model.to_choice_tuple()
+
+    def test_get_model_info_accepts_enum_or_string_provider(self):
+        """Test that model lookup works with either a ModelProvider or its string value."""
+        by_enum = get_model_info("gpt-4o", ModelProvider.OPENAI)
+        by_string = get_model_info("gpt-4o", "OpenAI")
+
+        assert by_enum is not None
+        assert by_enum is by_string
+        assert get_model_info("gpt-4o", ModelProvider.ANTHROPIC) is None
+        assert get_model_info("no-such-model", "OpenAI") is None
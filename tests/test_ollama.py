@@ -0,0 +1,84 @@
+from unittest.mock import Mock, patch
+
+import requests
+
+from src.utils import ollama
+
+
+class TestOllamaModelsCache:
+    """Test suite for the short-lived /api/tags response cache."""
+
+    def setup_method(self):
+        ollama._invalidate_models_cache()
+
+    def teardown_method(self):
+        ollama._invalidate_models_cache()
+
+    @staticmethod
+    def _tags_response(*names):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"models": [{"name": name} for name in names]}
+        return response
+
+    @patch('src.utils.ollama._session.get')
+    def test_reuses_response_within_ttl(self, mock_get):
+        """Test that repeated checks inside the TTL hit the server only once."""
+        mock_get.return_value = self._tags_response("llama3.1:latest")
+
+        assert ollama.is_ollama_server_running()
+        assert ollama.get_locally_available_models() == ["llama3.1:latest"]
+        assert ollama.get_locally_available_models() == ["llama3.1:latest"]
+
+        assert mock_get.call_count == 1
+
+    @patch('src.utils.ollama.time.monotonic')
+    @patch('src.utils.ollama._session.get')
+    def test_refetches_after_ttl_expires(self, mock_get, mock_monotonic):
+        """Test that a cached listing is refreshed once the TTL has elapsed."""
+        mock_get.side_effect = [self._tags_response("llama3.1:latest"), self._tags_response("llama3.1:latest", "mistral")]
+        mock_monotonic.return_value = 100.0
+        assert ollama.get_locally_available_models() == ["llama3.1:latest"]
+
+        mock_monotonic.return_value = 100.0 + ollama.OLLAMA_MODELS_CACHE_TTL + 1
+        assert ollama.get_locally_available_models() == ["llama3.1:latest", "mistral"]
+        assert mock_get.call_count == 2
+
+    @patch('src.utils.ollama._session.get')
+    def test_failures_are_not_cached(self, mock_get):
+        """Test that an unreachable server is re-probed so startup polling can see it come up."""
+        mock_get.side_effect = [requests.ConnectionError(), self._tags_response("llama3.1:latest")]
+
+        assert not ollama.is_ollama_server_running()
+        assert ollama.is_ollama_server_running()
+        assert mock_get.call_count == 2
+
+    @patch('src.utils.ollama._session.get')
+    def test_non_200_responses_are_not_cached(self, mock_get):
+        """Test that an error status is treated as not running and not cached."""
+        error_response = Mock()
+        error_response.status_code = 500
+        mock_get.side_effect = [error_response, self._tags_response()]
+
+        assert ollama.get_locally_available_models() == []
+        assert ollama.is_ollama_server_running()
+        assert mock_get.call_count == 2
+
+    @patch('src.utils.ollama._session.get')
+    def test_invalidate_forces_refetch(self, mock_get):
+        """Test that invalidating the cache (as after pull/rm) triggers a fresh request."""
+        mock_get.side_effect = [self._tags_response("llama3.1:latest"), self._tags_response()]
+
+        assert ollama.get_locally_available_models() == ["llama3.1:latest"]
+        ollama._invalidate_models_cache()
+        assert ollama.get_locally_available_models() == []
+        assert mock_get.call_count == 2
+
+    @patch('src.utils.ollama._session.get')
+    def test_returned_list_does_not_alias_cache(self, mock_get):
+        """Test that mutating the returned list does not corrupt the cached listing."""
+        mock_get.return_value = self._tags_response("llama3.1:latest")
+
+        ollama.get_locally_available_models().append("bogus")
+
+        assert ollama.get_locally_available_models() == ["llama3.1:latest"]
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+from unittest.mock import Mock, patch
+
+from src.data.cache import Cache
+from src.data.models import Price
+from src.tools.api import _prices_to_columns, get_price_data, prices_to_df
+
+PRICE_ROWS = [
+    {"open": 2.0, "close": 3.0, "high": 4.0, "low": 1.5, "volume": 200, "time": "2024-01-02T05:00:00Z"},
+    {"open": 1.0, "close": 2.0, "high": 3.0, "low": 0.5, "volume": 100, "time": "2024-01-01T05:00:00Z"},
+]
+
+
+class TestPriceData:
+    """Test suite for building price DataFrames from cached rows."""
+
+    def test_prices_to_columns_follows_price_schema(self):
+        """Test that cached rows become one typed array per Price field."""
+        columns = _prices_to_columns(PRICE_ROWS)
+
+        assert list(columns) == list(Price.model_fields)
+        assert columns["close"].dtype == np.float64
+        assert columns["volume"].dtype == np.int64
+        assert columns["close"].tolist() == [3.0, 2.0]
+        assert columns["time"].tolist() == ["2024-01-02T05:00:00Z", "2024-01-01T05:00:00Z"]
+
+    @patch('src.tools.api._cache', new_callable=Cache)
+    @patch('src.tools.api.requests.get')
+    def test_cached_frame_matches_fetched_frame(self, mock_get, mock_cache):
+        """Test that a cache hit reuses get_prices' cache key and yields the same frame as the API path."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"ticker": "AAPL", "prices": PRICE_ROWS}
+        mock_get.return_value = mock_response
+
+        fetched = get_price_data("AAPL", "2024-01-01", "2024-01-02")
+        cached = get_price_data("AAPL", "2024-01-01", "2024-01-02")
+
+        assert mock_get.call_count == 1
+        pd.testing.assert_frame_equal(cached, fetched)
+        pd.testing.assert_frame_equal(cached, prices_to_df([Price(**row) for row in PRICE_ROWS]))